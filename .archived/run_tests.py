@@ -10,8 +10,15 @@ import subprocess
 import sys
 import os
 import json
-import webbrowser
+import hashlib
+import html
 import re
+import shlex
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 try:
@@ -19,6 +26,69 @@ try:
     TQDM_AVAILABLE = True
 except ImportError:
     TQDM_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import jinja2
+    JINJA2_AVAILABLE = True
+except ImportError:
+    JINJA2_AVAILABLE = False
+try:
+    import xdist  # noqa: F401 - only needed so pytest can load the -n option
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
+
+# pytest-xdist workers: leave two cores free for the runner and the OS
+PARALLEL_WORKERS = max(1, (os.cpu_count() or 1) - 2)
+# Cleared by the --serial flag to force a single pytest process
+USE_XDIST = XDIST_AVAILABLE
+# Set by the --subprocess flag to run pytest in a child interpreter instead of in-process
+USE_SUBPROCESS = False
+
+COVERAGE_FILE = Path("coverage.json")
+# Collected test counts per command, reused until a file under SOURCE_DIRS changes
+TEST_COUNT_CACHE = Path("reports/.test_count.json")
+SOURCE_DIRS = ("Tests", "Strategies", "Exchanges", "Utils")
+
+# Child processes flush every write, so progress arrives as tests finish rather than in blocks
+CHILD_ENV = {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+# Coverage percentages at which the badge color and report status step up
+COVERAGE_THRESHOLDS = (70, 80, 90)
+SUMMARY_LEVELS = (("🔴", "POOR"), ("🟠", "NEEDS WORK"), ("🟡", "GOOD"), ("🟢", "EXCELLENT"))
+BADGE_COLORS = ("red", "orange", "yellow", "brightgreen")
+# Hex fills for the badge colors, matching shields.io's flat style
+BADGE_HEX = {"red": "#e05d44", "orange": "#fe7d37", "yellow": "#dfb317", "brightgreen": "#4c1"}
+BADGE_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="20" role="img" aria-label="coverage: {value}">
+  <linearGradient id="s" x2="0" y2="100%"><stop offset="0" stop-color="#bbb" stop-opacity=".1"/><stop offset="1" stop-opacity=".1"/></linearGradient>
+  <clipPath id="r"><rect width="{width}" height="20" rx="3" fill="#fff"/></clipPath>
+  <g clip-path="url(#r)">
+    <rect width="61" height="20" fill="#555"/>
+    <rect x="61" width="{value_width}" height="20" fill="{fill}"/>
+    <rect width="{width}" height="20" fill="url(#s)"/>
+  </g>
+  <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" font-size="11">
+    <text x="30.5" y="14">coverage</text>
+    <text x="{value_x}" y="14">{value}</text>
+  </g>
+</svg>
+"""
+STATUS_THRESHOLDS = (70, 90)
+STATUS_LEVELS = (("Needs Work", "poor"), ("Good", "good"), ("Excellent", "excellent"))
+
+# Threads used to write the coverage reports after a full run
+REPORT_WORKERS = 4
+
+# Per-test result in verbose pytest output; matched on bytes so lines are never decoded
+_STATUS_RE = re.compile(rb" (PASSED|FAILED|ERROR|SKIPPED) ")
+# Test count in the summary line of 'pytest --collect-only -q'
+_COLLECTED_RE = re.compile(rb"(\d+) tests? collected")
+# Bytes pulled from the pytest pipe per read
+READ_CHUNK_SIZE = 32768
 
 
 class Colors:
@@ -34,6 +104,10 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# (icon, color) per STATUS_THRESHOLDS bucket for the terminal file summary
+FILE_SUMMARY_STYLES = (("🔴", Colors.FAIL), ("🟡", Colors.WARNING), ("🟢", Colors.OKGREEN))
+
+
 def print_header(text):
     """Print a formatted header."""
     print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*70}")
@@ -41,30 +115,62 @@ def print_header(text):
     print(f"{'='*70}{Colors.ENDC}")
 
 
+# The one-line helpers below emit text and newline in a single write, so messages from
+# the concurrent report threads never run together on one line.
 def print_success(text):
     """Print success message."""
-    print(f"{Colors.OKGREEN}✅ {text}{Colors.ENDC}")
+    sys.stdout.write(f"{Colors.OKGREEN}✅ {text}{Colors.ENDC}\n")
 
 
 def print_error(text):
     """Print error message."""
-    print(f"{Colors.FAIL}❌ {text}{Colors.ENDC}")
+    sys.stdout.write(f"{Colors.FAIL}❌ {text}{Colors.ENDC}\n")
 
 
 def print_warning(text):
     """Print warning message."""
-    print(f"{Colors.WARNING}⚠️  {text}{Colors.ENDC}")
+    sys.stdout.write(f"{Colors.WARNING}⚠️  {text}{Colors.ENDC}\n")
 
 
 def print_info(text):
     """Print info message."""
-    print(f"{Colors.OKCYAN}ℹ️  {text}{Colors.ENDC}")
+    sys.stdout.write(f"{Colors.OKCYAN}ℹ️  {text}{Colors.ENDC}\n")
+
+
+def parallel_args():
+    """pytest-xdist arguments for sharding a run across CPU cores, or [] to run serially."""
+    if not USE_XDIST or PARALLEL_WORKERS < 2:
+        return []
+    return ["-n", str(PARALLEL_WORKERS), "--dist=loadfile"]
+
+
+def add_parallel_args(command):
+    """Shard a pytest command across CPU cores with pytest-xdist when available."""
+    xdist_args = parallel_args()
+    if not xdist_args or "-m pytest" not in command:
+        return command
+    return command.replace("-m pytest", f"-m pytest {shlex.join(xdist_args)}", 1)
+
+
+def run_captured(argv, timeout=300):
+    """Run argv with stdout/stderr spooled to temporary files rather than pipes."""
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        returncode = subprocess.run(argv, stdout=out, stderr=err, timeout=timeout, env=CHILD_ENV).returncode
+        out.seek(0)
+        err.seek(0)
+        return subprocess.CompletedProcess(
+            argv, returncode,
+            stdout=out.read().decode('utf-8', 'replace'), stderr=err.read().decode('utf-8', 'replace')
+        )
 
 
 def run_command(command, description, capture_output=True, show_progress=False):
     """Run a command and handle errors with enhanced output and optional progress bar."""
+    command = add_parallel_args(command)
+    # Run the program directly rather than through a shell
+    argv = shlex.split(command)
     print_header(description)
-    print_info(f"Command: {command}")
+    print_info(f"Command: {shlex.join(argv)}")
     
     try:
         if capture_output:
@@ -73,11 +179,11 @@ def run_command(command, description, capture_output=True, show_progress=False):
                 if "pytest" in command:
                     return run_pytest_with_progress(command, description)
                 else:
-                    result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=300)
+                    result = run_captured(argv)
             else:
-                result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=300)
+                result = run_captured(argv)
         else:
-            result = subprocess.run(command, shell=True, timeout=300)
+            result = subprocess.run(argv, timeout=300, env=CHILD_ENV)
             return True
         
         if result.stdout:
@@ -103,77 +209,142 @@ def run_command(command, description, capture_output=True, show_progress=False):
         return False
 
 
-def run_pytest_with_progress(command, description):
-    """Run pytest with a progress bar showing test execution."""
-    # First, discover tests to get total count
-    discovery_cmd = command.replace("pytest", "pytest --collect-only -q").replace("-v", "")
+def _source_signature():
+    """Fingerprint the mtimes of every Python file that can change test collection."""
+    digest = hashlib.md5(usedforsecurity=False)
+    for source_dir in SOURCE_DIRS:
+        for path in sorted(Path(source_dir).rglob("*.py")):
+            digest.update(f"{path}:{path.stat().st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def count_tests(discovery_cmd):
+    """Return how many tests discovery_cmd collects, reusing the saved count while sources are unchanged."""
+    signature = _source_signature()
+    try:
+        raw = TEST_COUNT_CACHE.read_bytes()
+        cached_counts = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except (OSError, ValueError):
+        cached_counts = {}
+    
+    cached = cached_counts.get(discovery_cmd)
+    if cached and cached.get("signature") == signature:
+        return cached["total_tests"]
     
     try:
         discovery_result = subprocess.run(
-            discovery_cmd, shell=True, capture_output=True, text=True, timeout=60
+            shlex.split(discovery_cmd), capture_output=True, timeout=60, env=CHILD_ENV
         )
         
-        # Count tests from collection output
-        if discovery_result.returncode == 0:
-            # Parse test count from pytest collection
-            lines = discovery_result.stdout.split('\n')
-            total_tests = 0
-            for line in lines:
-                if " tests collected" in line:
-                    total_tests = int(re.search(r'(\d+) tests collected', line).group(1))
-                    break
-        else:
-            total_tests = 0
+        # Count tests from collection output (searched as bytes; the listing is never decoded)
+        match = _COLLECTED_RE.search(discovery_result.stdout) if discovery_result.returncode == 0 else None
+        total_tests = int(match.group(1)) if match else 0
             
     except Exception:
         total_tests = 0
     
+    if total_tests:
+        cached_counts[discovery_cmd] = {"signature": signature, "total_tests": total_tests}
+        TEST_COUNT_CACHE.parent.mkdir(exist_ok=True)
+        write_json(TEST_COUNT_CACHE, cached_counts)
+    return total_tests
+
+
+def run_pytest(args, description):
+    """Run pytest with the given arguments in this interpreter, or in a child one with --subprocess."""
+    if USE_SUBPROCESS:
+        return run_command(f"python -m pytest {args}", description, show_progress=True)
+    
+    import pytest
+    
+    argv = parallel_args() + shlex.split(args)
+    print_header(description)
+    print_info(f"Command: pytest {shlex.join(argv)} (in-process)")
+    
+    try:
+        exit_code = pytest.main(argv)
+    except Exception as e:
+        print_error(f"{description} failed with exception: {e}")
+        return False
+    
+    if exit_code != 0:
+        print_error(f"{description} failed with return code {int(exit_code)}")
+        return False
+    else:
+        print_success(f"{description} completed successfully")
+        return True
+
+
+def run_pytest_with_progress(command, description):
+    """Run pytest with a progress bar showing test execution."""
+    # First, discover tests to get total count
+    discovery_cmd = command.replace("pytest", "pytest --collect-only -q -p no:cacheprovider").replace("-v", "")
+    argv = shlex.split(command)
+    total_tests = count_tests(discovery_cmd)
+    
     if total_tests == 0:
         print_warning("Could not determine test count, running without progress bar")
-        result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=300)
+        result = run_captured(argv)
     else:
         print_info(f"Running {total_tests} tests with progress tracking...")
         
         # Run pytest with real-time output
         process = subprocess.Popen(
-            command,
-            shell=True,
+            argv,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
+            bufsize=0,
+            env=CHILD_ENV
         )
         
         pbar = tqdm(total=total_tests, desc="Tests", unit="test", 
                    bar_format="{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]")
         
-        output_lines = []
-        passed_count = 0
-        failed_count = 0
-        
-        for line in iter(process.stdout.readline, ''):
-            output_lines.append(line)
+        output_chunks = []
+        pending = bytearray()
+        status_counts = {b"PASSED": 0, b"FAILED": 0, b"ERROR": 0, b"SKIPPED": 0}
+        stdout_fd = process.stdout.fileno()
+        
+        # Drain the pipe in large chunks so pytest never blocks on a full pipe
+        while True:
+            chunk = os.read(stdout_fd, READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            output_chunks.append(chunk)
+            pending += chunk
             
-            # Update progress based on pytest output
-            if " PASSED " in line or " FAILED " in line or " ERROR " in line or " SKIPPED " in line:
-                pbar.update(1)
-                if " PASSED " in line:
-                    passed_count += 1
-                elif " FAILED " in line or " ERROR " in line:
-                    failed_count += 1
-                    
-                # Update description with current stats
-                if failed_count > 0:
-                    pbar.set_description(f"Tests (✅{passed_count} ❌{failed_count})")
-                else:
-                    pbar.set_description(f"Tests (✅{passed_count})")
+            # Only complete lines are matched; a partial last line waits for the next chunk
+            end = pending.rfind(b"\n") + 1
+            if not end:
+                continue
+            
+            # Update progress based on pytest output (xdist prefixes lines with "[gwN]")
+            finished = 0
+            for line in pending[:end].split(b"\n"):
+                match = _STATUS_RE.search(line)
+                if match is not None:
+                    status_counts[match.group(1)] += 1
+                    finished += 1
+            del pending[:end]
+            if not finished:
+                continue
+            pbar.update(finished)
+            
+            # Update description with current stats
+            passed_count = status_counts[b"PASSED"]
+            failed_count = status_counts[b"FAILED"] + status_counts[b"ERROR"]
+            if failed_count > 0:
+                pbar.set_description_str(f"Tests (✅{passed_count} ❌{failed_count})")
+            else:
+                pbar.set_description_str(f"Tests (✅{passed_count})")
         
         process.wait()
         pbar.close()
         
         result = subprocess.CompletedProcess(
             process.args, process.returncode, 
-            stdout=''.join(output_lines), stderr=""
+            stdout=b''.join(output_chunks).decode('utf-8', 'replace'), stderr=""
         )
     
     # Process the result same as regular run_command
@@ -193,6 +364,36 @@ def run_pytest_with_progress(command, description):
         return True
 
 
+def badge_color(coverage):
+    """Return the shields.io color name for a coverage percentage."""
+    return BADGE_COLORS[bisect_right(COVERAGE_THRESHOLDS, coverage)]
+
+
+def coverage_status(coverage):
+    """Return the (label, CSS level) pair the HTML reports use for a coverage percentage."""
+    return STATUS_LEVELS[bisect_right(STATUS_THRESHOLDS, coverage)]
+
+
+@lru_cache(maxsize=4)
+def _load_coverage_cached(mtime_ns):
+    """Parse coverage.json; keyed on its mtime so a rewritten file is re-read."""
+    raw = COVERAGE_FILE.read_bytes()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def load_coverage():
+    """Return the parsed coverage.json, shared by every report generator."""
+    return _load_coverage_cached(COVERAGE_FILE.stat().st_mtime_ns)
+
+
+def write_json(path, data):
+    """Write data to path as indented JSON."""
+    if ORJSON_AVAILABLE:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        Path(path).write_text(json.dumps(data, indent=2))
+
+
 def ensure_directories():
     """Ensure required directories exist."""
     dirs = ['reports', 'htmlcov']
@@ -203,15 +404,12 @@ def ensure_directories():
 
 def check_coverage_results():
     """Check coverage results and provide detailed feedback."""
-    coverage_file = Path("coverage.json")
-    
-    if not coverage_file.exists():
+    if not COVERAGE_FILE.exists():
         print_warning("Coverage JSON file not found")
         return False
     
     try:
-        with open(coverage_file, 'r') as f:
-            coverage_data = json.load(f)
+        coverage_data = load_coverage()
         
         total_coverage = coverage_data.get('totals', {}).get('percent_covered', 0)
         
@@ -228,23 +426,24 @@ def check_coverage_results():
         low_coverage_files = []
         
         print(f"\n{Colors.BOLD}File Coverage Details:{Colors.ENDC}")
+        # Bind the colors once rather than looking them up on Colors for every file
+        fail, warning, ok, endc = Colors.FAIL, Colors.WARNING, Colors.OKGREEN, Colors.ENDC
         for file_path, file_data in files.items():
             file_coverage = file_data.get('summary', {}).get('percent_covered', 0)
             
             if file_coverage < 90:
-                low_coverage_files.append((file_path, file_coverage))
-                color = Colors.FAIL
+                low_coverage_files.append((file_path, file_coverage, file_data.get('missing_lines', [])))
+                color = fail
             elif file_coverage < 95:
-                color = Colors.WARNING
+                color = warning
             else:
-                color = Colors.OKGREEN
+                color = ok
             
-            print(f"  {color}{file_path}: {file_coverage:.2f}%{Colors.ENDC}")
+            print(f"  {color}{file_path}: {file_coverage:.2f}%{endc}")
         
         if low_coverage_files:
-            print_warning(f"Files below 90% coverage:")
-            for file_path, coverage in low_coverage_files:
-                missing_lines = files[file_path].get('missing_lines', [])
+            print_warning("Files below 90% coverage:")
+            for file_path, coverage, missing_lines in low_coverage_files:
                 print(f"  - {file_path}: {coverage:.2f}%")
                 if missing_lines:
                     print(f"    Missing lines: {missing_lines[:10]}{'...' if len(missing_lines) > 10 else ''}")
@@ -256,310 +455,84 @@ def check_coverage_results():
         return False
 
 
-def generate_coverage_badge():
-    """Generate a coverage badge based on current coverage."""
-    try:
-        with open("coverage.json", 'r') as f:
-            coverage_data = json.load(f)
-        
-        total_coverage = coverage_data.get('totals', {}).get('percent_covered', 0)
-        
-        # Determine badge color based on coverage
-        if total_coverage >= 90:
-            color = "brightgreen"
-        elif total_coverage >= 80:
-            color = "yellow"
-        elif total_coverage >= 70:
-            color = "orange"
-        else:
-            color = "red"
-        
-        # Create a simple coverage badge info
-        badge_info = {
-            "coverage": f"{total_coverage:.1f}%",
-            "color": color,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        with open("reports/coverage_badge.json", "w") as f:
-            json.dump(badge_info, f, indent=2)
-        
-        print_info(f"Coverage badge generated: {total_coverage:.1f}% ({color})")
-        
-    except Exception as e:
-        print_warning(f"Could not generate coverage badge: {e}")
+# HTML report templates (templates/*.html.j2 next to this script), compiled once at import
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+# Report files are streamed through a buffer larger than the 8 KiB default
+HTML_WRITE_BUFFER = 1 << 16
+if JINJA2_AVAILABLE:
+    _JINJA_ENV = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATE_DIR), keep_trailing_newline=True, auto_reload=False
+    )
+    ENHANCED_REPORT_TEMPLATE = _JINJA_ENV.get_template("coverage_visual.html.j2")
+    COMBINED_REPORT_TEMPLATE = _JINJA_ENV.get_template("coverage_combined.html.j2")
+
+
+def write_template(template, path, **context):
+    """Render template into path chunk by chunk through a 64 KiB write buffer."""
+    with open(path, "wb", buffering=HTML_WRITE_BUFFER) as f:
+        write = f.write
+        for chunk in template.generate(**context):
+            write(chunk.encode('utf-8'))
 
 
 def generate_enhanced_coverage_html():
     """Generate an enhanced HTML coverage report with visual progress bars."""
-    coverage_file = Path("coverage.json")
+    if not JINJA2_AVAILABLE:
+        print_warning("jinja2 not installed. Install with: python run_tests.py install")
+        return
     
-    if not coverage_file.exists():
+    if not COVERAGE_FILE.exists():
         print_warning("No coverage data found. Cannot generate enhanced HTML report.")
         return
     
     try:
-        with open(coverage_file, 'r') as f:
-            coverage_data = json.load(f)
+        coverage_data = load_coverage()
         
         total_coverage = coverage_data.get('totals', {}).get('percent_covered', 0)
         files = coverage_data.get('files', {})
         
-        # Filter out __init__.py files
-        filtered_files = {path: data for path, data in files.items() 
-                         if not path.endswith('__init__.py')}
-        
-        # Generate HTML
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Coverage Report - Crypto Trading Bot</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-        }}
-        .header p {{
-            margin: 10px 0 0 0;
-            opacity: 0.9;
-        }}
-        .overall-stats {{
-            padding: 30px;
-            background: #fff;
-            border-bottom: 1px solid #eee;
-        }}
-        .stat-card {{
-            display: inline-block;
-            margin: 10px 20px 10px 0;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            min-width: 150px;
-            text-align: center;
-        }}
-        .stat-value {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #333;
-        }}
-        .stat-label {{
-            color: #666;
-            margin-top: 5px;
-        }}
-        .progress-bar {{
-            width: 100%;
-            height: 30px;
-            background-color: #e9ecef;
-            border-radius: 15px;
-            overflow: hidden;
-            margin: 10px 0;
-            position: relative;
-        }}
-        .progress-fill {{
-            height: 100%;
-            border-radius: 15px;
-            transition: width 0.5s ease;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-            text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
-        }}
-        .progress-excellent {{ background: linear-gradient(90deg, #28a745, #20c997); }}
-        .progress-good {{ background: linear-gradient(90deg, #ffc107, #fd7e14); }}
-        .progress-poor {{ background: linear-gradient(90deg, #dc3545, #e83e8c); }}
-        .files-table {{
-            padding: 30px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background-color: #f8f9fa;
-            font-weight: 600;
-            color: #495057;
-        }}
-        tr:hover {{
-            background-color: #f8f9fa;
-        }}
-        .file-progress {{
-            width: 200px;
-            height: 20px;
-            background-color: #e9ecef;
-            border-radius: 10px;
-            overflow: hidden;
-            position: relative;
-        }}
-        .file-progress-fill {{
-            height: 100%;
-            border-radius: 10px;
-            transition: width 0.3s ease;
-        }}
-        .coverage-text {{
-            font-weight: bold;
-            text-align: center;
-            min-width: 60px;
-        }}
-        .excellent {{ color: #28a745; }}
-        .good {{ color: #ffc107; }}
-        .poor {{ color: #dc3545; }}
-        .footer {{
-            padding: 20px;
-            text-align: center;
-            background: #f8f9fa;
-            color: #666;
-            border-top: 1px solid #eee;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🧪 Coverage Report</h1>
-            <p>Crypto Trading Bot - Test Coverage Analysis</p>
-        </div>
-        
-        <div class="overall-stats">
-            <h2>📊 Overall Statistics</h2>
-            <div class="stat-card">
-                <div class="stat-value">{total_coverage:.1f}%</div>
-                <div class="stat-label">Total Coverage</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{len(filtered_files)}</div>
-                <div class="stat-label">Files Analyzed</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{sum(1 for _, data in filtered_files.items() if data.get('summary', {}).get('percent_covered', 0) >= 90)}</div>
-                <div class="stat-label">Files ≥90%</div>
-            </div>
-            
-            <h3>Overall Progress</h3>
-            <div class="progress-bar">
-                <div class="progress-fill progress-{'excellent' if total_coverage >= 90 else 'good' if total_coverage >= 70 else 'poor'}" 
-                     style="width: {total_coverage}%">
-                    {total_coverage:.1f}%
-                </div>
-            </div>
-        </div>
-        
-        <div class="files-table">
-            <h2>📁 File Coverage Details</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>File</th>
-                        <th>Coverage</th>
-                        <th>Progress</th>
-                        <th>Status</th>
-                    </tr>
-                </thead>
-                <tbody>
-"""
+        # Single pass: filter out __init__.py files and count files at the 90% target
+        sorted_files = []
+        files_above_90 = 0
+        for path, data in files.items():
+            if path.endswith('__init__.py'):
+                continue
+            coverage = data.get('summary', {}).get('percent_covered', 0)
+            if coverage >= 90:
+                files_above_90 += 1
+            sorted_files.append((path, coverage, data))
         
         # Sort files by coverage percentage
-        sorted_files = sorted(
-            [(path, data.get('summary', {}).get('percent_covered', 0), data) 
-             for path, data in filtered_files.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )
+        sorted_files.sort(key=itemgetter(1), reverse=True)
         
+        rows = []
         for file_path, coverage, data in sorted_files:
             filename = file_path.replace('\\', '/').split('/')[-1]
             
             # Determine status and color
-            if coverage >= 90:
-                status = "Excellent"
-                status_class = "excellent"
-                progress_class = "progress-excellent"
-            elif coverage >= 70:
-                status = "Good"
-                status_class = "good"
-                progress_class = "progress-good"
-            else:
-                status = "Needs Work"
-                status_class = "poor"
-                progress_class = "progress-poor"
+            status, level = coverage_status(coverage)
+            status_class = level
+            progress_class = f"progress-{level}"
             
-            html_content += f"""
-                    <tr>
-                        <td><strong>{filename}</strong></td>
-                        <td class="coverage-text {status_class}">{coverage:.1f}%</td>
-                        <td>
-                            <div class="file-progress">
-                                <div class="file-progress-fill {progress_class}" style="width: {coverage}%"></div>
-                            </div>
-                        </td>
-                        <td class="{status_class}">{status}</td>
-                    </tr>
-"""
-        
-        html_content += f"""
-                </tbody>
-            </table>
-        </div>
-        
-        <div class="footer">
-            <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | 
-               <a href="htmlcov/index.html">View Detailed Coverage Report</a></p>
-        </div>
-    </div>
-    
-    <script>
-        // Add some interactivity
-        document.addEventListener('DOMContentLoaded', function() {{
-            const progressBars = document.querySelectorAll('.progress-fill, .file-progress-fill');
-            progressBars.forEach(bar => {{
-                const width = bar.style.width;
-                bar.style.width = '0%';
-                setTimeout(() => {{
-                    bar.style.width = width;
-                }}, 100);
-            }});
-        }});
-    </script>
-</body>
-</html>
-"""
-        
-        # Write the HTML file
-        reports_dir = Path("reports")
-        reports_dir.mkdir(exist_ok=True)
-        
-        with open("reports/coverage_visual.html", "w", encoding='utf-8') as f:
-            f.write(html_content)
+            # Escape once here; the template emits row values verbatim (autoescape is off)
+            rows.append({
+                "name": html.escape(filename),
+                "coverage": coverage,
+                "status": status,
+                "status_class": status_class,
+                "progress_class": progress_class
+            })
+        
+        # Write the HTML file, streaming the rendered template instead of building one string
+        Path("reports").mkdir(exist_ok=True)
+        write_template(
+            ENHANCED_REPORT_TEMPLATE, "reports/coverage_visual.html",
+            total_coverage=total_coverage,
+            overall_progress_class=f"progress-{coverage_status(total_coverage)[1]}",
+            files_above_90=files_above_90,
+            files=rows,
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
         
         print_success("Enhanced HTML coverage report generated: reports/coverage_visual.html")
         
@@ -569,24 +542,33 @@ def generate_enhanced_coverage_html():
 
 def generate_coverage_badge():
     """Generate a coverage badge for the README."""
-    coverage_file = Path("coverage.json")
-    
-    if coverage_file.exists():
+    if COVERAGE_FILE.exists():
         try:
-            with open(coverage_file, 'r') as f:
-                coverage_data = json.load(f)
+            coverage_data = load_coverage()
             
             total_coverage = coverage_data.get('totals', {}).get('percent_covered', 0)
             
             # Color based on coverage percentage
-            if total_coverage >= 90:
-                color = "brightgreen"
-            elif total_coverage >= 80:
-                color = "yellow"
-            elif total_coverage >= 70:
-                color = "orange"
-            else:
-                color = "red"
+            color = badge_color(total_coverage)
+            
+            # Create a simple coverage badge info
+            badge_info = {
+                "coverage": f"{total_coverage:.1f}%",
+                "color": color,
+                "timestamp": datetime.now().isoformat()
+            }
+            Path("reports").mkdir(exist_ok=True)
+            write_json("reports/coverage_badge.json", badge_info)
+            
+            # Render the badge locally so README previews don't depend on shields.io
+            value = f"{total_coverage:.1f}%"
+            value_width = 7 * len(value) + 10
+            badge_svg = BADGE_SVG.format(
+                width=61 + value_width, value_width=value_width, value_x=61 + value_width / 2,
+                value=value, fill=BADGE_HEX[color]
+            )
+            Path("reports/coverage.svg").write_bytes(badge_svg.encode('utf-8'))
+            print_info("Coverage badge written: reports/coverage.svg")
             
             badge_url = f"https://img.shields.io/badge/coverage-{total_coverage:.1f}%25-{color}"
             print_info(f"Coverage badge: {badge_url}")
@@ -599,12 +581,27 @@ def generate_coverage_badge():
     return None
 
 
+@lru_cache(maxsize=None)
+def get_html_filename(file_path):
+    """Convert file path to coverage HTML filename."""
+    # This mimics how coverage.py generates HTML filenames
+    # Normalize path separators
+    normalized_path = file_path.replace('\\', '/')
+    # Create hash-based filename similar to coverage.py (a name, not a security digest)
+    path_hash = hashlib.md5(normalized_path.encode(), usedforsecurity=False).hexdigest()[:16]
+    safe_name = normalized_path.replace('/', '_').replace('\\', '_').replace('.', '_')
+    return f"z_{path_hash}_{safe_name}_py.html"
+
+
 def generate_combined_coverage_html():
     """Generate a combined HTML coverage report with visual styling and hyperlinks to detailed pages."""
-    coverage_file = Path("coverage.json")
+    if not JINJA2_AVAILABLE:
+        print_warning("jinja2 not installed. Install with: python run_tests.py install")
+        return
+    
     htmlcov_dir = Path("htmlcov")
     
-    if not coverage_file.exists():
+    if not COVERAGE_FILE.exists():
         print_warning("No coverage data found. Cannot generate enhanced HTML report.")
         return
     
@@ -613,345 +610,67 @@ def generate_combined_coverage_html():
         return
     
     try:
-        with open(coverage_file, 'r') as f:
-            coverage_data = json.load(f)
+        coverage_data = load_coverage()
         
         total_coverage = coverage_data.get('totals', {}).get('percent_covered', 0)
         files = coverage_data.get('files', {})
         
-        # Filter out __init__.py files
-        filtered_files = {path: data for path, data in files.items() 
-                         if not path.endswith('__init__.py')}
-        
-        # Create mapping from file paths to HTML file names
-        def get_html_filename(file_path):
-            """Convert file path to coverage HTML filename."""
-            # This mimics how coverage.py generates HTML filenames
-            import hashlib
-            # Normalize path separators
-            normalized_path = file_path.replace('\\', '/')
-            # Create hash-based filename similar to coverage.py
-            path_hash = hashlib.md5(normalized_path.encode()).hexdigest()[:16]
-            safe_name = normalized_path.replace('/', '_').replace('\\', '_').replace('.', '_')
-            return f"z_{path_hash}_{safe_name}_py.html"
-        
-        # Generate HTML content
-        html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Coverage Report - Crypto Trading Bot</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-        }}
-        .header p {{
-            margin: 10px 0 0 0;
-            opacity: 0.9;
-        }}
-        .overall-stats {{
-            padding: 30px;
-            background: #fff;
-            border-bottom: 1px solid #eee;
-        }}
-        .stat-card {{
-            display: inline-block;
-            margin: 10px 20px 10px 0;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            min-width: 150px;
-            text-align: center;
-        }}
-        .stat-card h3 {{
-            margin: 0 0 10px 0;
-            font-size: 2em;
-            color: #333;
-        }}
-        .stat-card p {{
-            margin: 0;
-            color: #666;
-        }}
-        .progress-container {{
-            margin: 20px 0;
-        }}
-        .progress-bar {{
-            width: 100%;
-            height: 30px;
-            background-color: #e9ecef;
-            border-radius: 15px;
-            overflow: hidden;
-            position: relative;
-        }}
-        .progress-fill {{
-            height: 100%;
-            transition: width 0.8s ease-in-out;
-            position: relative;
-        }}
-        .progress-excellent {{
-            background: linear-gradient(45deg, #28a745, #20c997);
-        }}
-        .progress-good {{
-            background: linear-gradient(45deg, #ffc107, #fd7e14);
-        }}
-        .progress-poor {{
-            background: linear-gradient(45deg, #dc3545, #e74c3c);
-        }}
-        .progress-text {{
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            color: white;
-            font-weight: bold;
-            text-shadow: 1px 1px 2px rgba(0,0,0,0.5);
-        }}
-        .files-section {{
-            padding: 30px;
-        }}
-        .file-item {{
-            display: flex;
-            align-items: center;
-            padding: 15px;
-            margin: 10px 0;
-            background: #f8f9fa;
-            border-radius: 8px;
-            transition: all 0.3s ease;
-        }}
-        .file-item:hover {{
-            background: #e9ecef;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
-        .file-name {{
-            flex: 1;
-            font-weight: 600;
-            color: #495057;
-        }}
-        .file-name a {{
-            color: #495057;
-            text-decoration: none;
-            transition: color 0.3s ease;
-        }}
-        .file-name a:hover {{
-            color: #007bff;
-            text-decoration: underline;
-        }}
-        .file-progress {{
-            flex: 2;
-            margin: 0 20px;
-        }}
-        .file-percentage {{
-            min-width: 80px;
-            text-align: right;
-            font-weight: bold;
-        }}
-        .file-status {{
-            min-width: 100px;
-            text-align: center;
-            font-size: 0.9em;
-        }}
-        .status-excellent {{
-            color: #28a745;
-            font-weight: bold;
-        }}
-        .status-good {{
-            color: #ffc107;
-            font-weight: bold;
-        }}
-        .status-poor {{
-            color: #dc3545;
-            font-weight: bold;
-        }}
-        .file-progress .progress-bar {{
-            height: 20px;
-        }}
-        .navigation {{
-            padding: 20px 30px;
-            background: #f8f9fa;
-            border-top: 1px solid #eee;
-        }}
-        .nav-links {{
-            display: flex;
-            gap: 20px;
-            justify-content: center;
-        }}
-        .nav-link {{
-            padding: 10px 20px;
-            background: #007bff;
-            color: white;
-            text-decoration: none;
-            border-radius: 5px;
-            transition: background 0.3s ease;
-        }}
-        .nav-link:hover {{
-            background: #0056b3;
-        }}
-        .timestamp {{
-            text-align: center;
-            color: #6c757d;
-            font-size: 0.9em;
-            margin-top: 10px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🧪 Crypto Trading Bot Coverage Report</h1>
-            <p>Comprehensive test coverage analysis with detailed insights</p>
-        </div>
-        
-        <div class="overall-stats">
-            <div class="stat-card">
-                <h3>{total_coverage:.1f}%</h3>
-                <p>Total Coverage</p>
-            </div>
-            <div class="stat-card">
-                <h3>{len(filtered_files)}</h3>
-                <p>Files Analyzed</p>
-            </div>
-            <div class="stat-card">
-                <h3>{sum(data.get('summary', {}).get('num_statements', 0) for data in filtered_files.values())}</h3>
-                <p>Total Statements</p>
-            </div>
-            
-            <div class="progress-container">
-                <div class="progress-bar">
-                    <div class="progress-fill {'progress-excellent' if total_coverage >= 90 else 'progress-good' if total_coverage >= 70 else 'progress-poor'}" 
-                         style="width: {total_coverage}%">
-                        <div class="progress-text">{total_coverage:.1f}% Overall Coverage</div>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="files-section">
-            <h2>📁 File Coverage Details</h2>
-"""
+        # Single pass: filter out __init__.py files and total the statements
+        sorted_files = []
+        total_statements = 0
+        for path, data in files.items():
+            if path.endswith('__init__.py'):
+                continue
+            summary = data.get('summary', {})
+            total_statements += summary.get('num_statements', 0)
+            sorted_files.append((path, summary.get('percent_covered', 0)))
         
         # Sort files by coverage percentage (lowest first to highlight problem areas)
-        sorted_files = sorted(filtered_files.items(), 
-                            key=lambda x: x[1].get('summary', {}).get('percent_covered', 0))
+        sorted_files.sort(key=itemgetter(1))
+        
+        # List htmlcov once; the per-file lookups below then never touch the filesystem
+        htmlcov_pages = [f.name for f in htmlcov_dir.glob("*.html")]
+        htmlcov_page_set = set(htmlcov_pages)
         
-        for file_path, file_data in sorted_files:
-            coverage = file_data.get('summary', {}).get('percent_covered', 0)
-            statements = file_data.get('summary', {}).get('num_statements', 0)
-            missing = file_data.get('summary', {}).get('missing_lines', 0)
+        rows = []
+        for file_path, coverage in sorted_files:
             
             # Determine status and progress class
-            if coverage >= 90:
-                status = "Excellent"
-                status_class = "status-excellent"
-                progress_class = "progress-excellent"
-            elif coverage >= 70:
-                status = "Good"
-                status_class = "status-good"
-                progress_class = "progress-good"
-            else:
-                status = "Needs Work"
-                status_class = "status-poor"
-                progress_class = "progress-poor"
+            status, level = coverage_status(coverage)
+            status_class = f"status-{level}"
+            progress_class = f"progress-{level}"
             
             # Try to find the corresponding HTML file
             html_filename = get_html_filename(file_path)
-            html_path = htmlcov_dir / html_filename
             
             # Check if HTML file exists, otherwise look for similar files
-            if not html_path.exists():
+            if html_filename not in htmlcov_page_set:
                 # Try to find the file by looking for files containing the base name
-                base_name = Path(file_path).stem
-                matching_files = [f for f in htmlcov_dir.glob("*.html") 
-                                if base_name.replace('_', '') in f.name or 
-                                   file_path.replace('\\', '_').replace('/', '_') in f.name]
-                if matching_files:
-                    html_filename = matching_files[0].name
-                else:
-                    html_filename = None
-            
-            # Create the file item HTML
-            file_display_name = file_path.replace('\\', '/')
-            if html_filename:
-                file_link = f'<a href="htmlcov/{html_filename}" target="_blank">{file_display_name}</a>'
-            else:
-                file_link = file_display_name
+                base_name = Path(file_path).stem.replace('_', '')
+                flat_path = file_path.replace('\\', '_').replace('/', '_')
+                html_filename = next((name for name in htmlcov_pages
+                                      if base_name in name or flat_path in name), None)
             
-            html_content += f"""
-            <div class="file-item">
-                <div class="file-name">{file_link}</div>
-                <div class="file-progress">
-                    <div class="progress-bar">
-                        <div class="progress-fill {progress_class}" style="width: {coverage}%">
-                            <div class="progress-text">{coverage:.1f}%</div>
-                        </div>
-                    </div>
-                </div>
-                <div class="file-percentage">{coverage:.1f}%</div>
-                <div class="file-status {status_class}">{status}</div>
-            </div>
-"""
-        
-        # Add footer with navigation
-        html_content += f"""
-        </div>
-        
-        <div class="navigation">
-            <div class="nav-links">
-                <a href="htmlcov/index.html" class="nav-link" target="_blank">📊 Standard Coverage Report</a>
-                <a href="htmlcov/function_index.html" class="nav-link" target="_blank">⚙️ Function Coverage</a>
-                <a href="htmlcov/class_index.html" class="nav-link" target="_blank">🏗️ Class Coverage</a>
-                <a href="reports/test_report.html" class="nav-link" target="_blank">🧪 Test Results</a>
-            </div>
-            <div class="timestamp">Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M:%S')}</div>
-        </div>
-    </div>
-
-    <script>
-        // Animate progress bars on page load
-        document.addEventListener('DOMContentLoaded', function() {{
-            const progressBars = document.querySelectorAll('.progress-fill');
-            progressBars.forEach(bar => {{
-                const width = bar.style.width;
-                bar.style.width = '0%';
-                setTimeout(() => {{
-                    bar.style.width = width;
-                }}, 100);
-            }});
-        }});
-    </script>
-</body>
-</html>
-"""
-        
-        # Write the HTML file
-        reports_dir = Path("reports")
-        reports_dir.mkdir(exist_ok=True)
-        
-        with open("reports/coverage_combined.html", "w", encoding='utf-8') as f:
-            f.write(html_content)
+            # Escape once here; the template emits row values verbatim (autoescape is off)
+            rows.append({
+                "name": html.escape(file_path.replace('\\', '/')),
+                "html_filename": html.escape(html_filename) if html_filename else None,
+                "coverage": coverage,
+                "status": status,
+                "status_class": status_class,
+                "progress_class": progress_class
+            })
+        
+        # Write the HTML file, streaming the rendered template instead of building one string
+        Path("reports").mkdir(exist_ok=True)
+        write_template(
+            COMBINED_REPORT_TEMPLATE, "reports/coverage_combined.html",
+            total_coverage=total_coverage,
+            overall_progress_class=f"progress-{coverage_status(total_coverage)[1]}",
+            total_statements=total_statements,
+            files=rows,
+            generated=datetime.now().strftime('%Y-%m-%d at %H:%M:%S')
+        )
         
         print_success("Enhanced combined coverage report generated: reports/coverage_combined.html")
         print_info("✨ Features: Visual progress bars, hyperlinks to detailed coverage, and modern UI!")
@@ -962,8 +681,37 @@ def generate_combined_coverage_html():
         traceback.print_exc()
 
 
+# OS command that opens a file in its default application, chosen once at import;
+# Windows has no such command and uses os.startfile instead
+if sys.platform == "win32":
+    OPEN_COMMAND = None
+elif sys.platform == "darwin":
+    OPEN_COMMAND = "open"
+else:
+    OPEN_COMMAND = "xdg-open"
+
+
+def open_in_browser(report_file):
+    """Hand a report to the OS default browser without waiting for it to launch."""
+    if OPEN_COMMAND is None:
+        os.startfile(report_file)
+        return
+    try:
+        subprocess.Popen(
+            [OPEN_COMMAND, report_file.as_uri()],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except FileNotFoundError:
+        # No desktop opener installed (e.g. xdg-utils missing); let webbrowser find a browser
+        import webbrowser
+        webbrowser.open(report_file.as_uri())
+
+
 def open_reports():
     """Open generated reports in browser."""
+    
     reports = [
         ("htmlcov/index.html", "Coverage Report"),
         ("reports/test_report.html", "Test Results Report")
@@ -972,12 +720,13 @@ def open_reports():
     print_header("Opening Reports")
     
     for report_path, report_name in reports:
-        if Path(report_path).exists():
+        report_file = Path(report_path).resolve()
+        if report_file.is_file():
             try:
-                abs_path = Path(report_path).absolute()
-                webbrowser.open(f"file://{abs_path}")
+                report_uri = report_file.as_uri()
+                open_in_browser(report_file)
                 print_success(f"Opened {report_name}")
-                print_info(f"URL: file://{abs_path}")
+                print_info(f"URL: {report_uri}")
             except Exception as e:
                 print_warning(f"Could not open {report_name}: {e}")
         else:
@@ -986,14 +735,16 @@ def open_reports():
 
 def open_enhanced_coverage():
     """Open the enhanced visual coverage report."""
+    
     enhanced_path = "reports/coverage_visual.html"
     
-    if Path(enhanced_path).exists():
+    report_file = Path(enhanced_path).resolve()
+    if report_file.is_file():
         try:
-            abs_path = Path(enhanced_path).absolute()
-            webbrowser.open(f"file://{abs_path}")
+            report_uri = report_file.as_uri()
+            open_in_browser(report_file)
             print_success("Enhanced coverage report opened in browser")
-            print_info(f"URL: file://{abs_path}")
+            print_info(f"URL: {report_uri}")
             print_info("✨ Features: Visual progress bars, file statistics, and interactive elements!")
         except Exception as e:
             print_error(f"Could not open enhanced coverage report: {e}")
@@ -1003,28 +754,16 @@ def open_enhanced_coverage():
 
 def open_coverage_only():
     """Open only the HTML coverage report."""
-    coverage_path = "htmlcov/index.html"
     
-    if Path(coverage_path).exists():
-        try:
-            abs_path = Path(coverage_path).absolute()
-            webbrowser.open(f"file://{abs_path}")
-            print_success("Coverage report opened in browser")
-            print_info(f"URL: file://{abs_path}")
-            print_info("💡 Tip: Bookmark this URL for quick access!")
-        except Exception as e:
-            print_error(f"Could not open coverage report: {e}")
-    else:
-        print_error("Coverage report not found. Run tests first with: python run_tests.py all")
-    """Open only the HTML coverage report."""
     coverage_path = "htmlcov/index.html"
     
-    if Path(coverage_path).exists():
+    report_file = Path(coverage_path).resolve()
+    if report_file.is_file():
         try:
-            abs_path = Path(coverage_path).absolute()
-            webbrowser.open(f"file://{abs_path}")
+            report_uri = report_file.as_uri()
+            open_in_browser(report_file)
             print_success("Coverage report opened in browser")
-            print_info(f"URL: file://{abs_path}")
+            print_info(f"URL: {report_uri}")
             print_info("💡 Tip: Bookmark this URL for quick access!")
         except Exception as e:
             print_error(f"Could not open coverage report: {e}")
@@ -1034,33 +773,19 @@ def open_coverage_only():
 
 def show_coverage_summary():
     """Show a quick coverage summary in terminal."""
-    coverage_file = Path("coverage.json")
-    
-    if not coverage_file.exists():
+    if not COVERAGE_FILE.exists():
         print_error("No coverage data found. Run tests first with: python run_tests.py all")
         return
     
     try:
-        with open(coverage_file, 'r') as f:
-            coverage_data = json.load(f)
+        coverage_data = load_coverage()
         
         total_coverage = coverage_data.get('totals', {}).get('percent_covered', 0)
         
         print_header("📊 Coverage Summary")
         
         # Overall coverage with visual indicator
-        if total_coverage >= 90:
-            coverage_icon = "🟢"
-            status = "EXCELLENT"
-        elif total_coverage >= 80:
-            coverage_icon = "🟡"
-            status = "GOOD"
-        elif total_coverage >= 70:
-            coverage_icon = "🟠"
-            status = "NEEDS WORK"
-        else:
-            coverage_icon = "🔴"
-            status = "POOR"
+        coverage_icon, status = SUMMARY_LEVELS[bisect_right(COVERAGE_THRESHOLDS, total_coverage)]
         
         print(f"{coverage_icon} {Colors.BOLD}Overall Coverage: {total_coverage:.1f}% ({status}){Colors.ENDC}")
         
@@ -1073,26 +798,18 @@ def show_coverage_summary():
             file_coverage = [(file_path, file_data.get('summary', {}).get('percent_covered', 0)) 
                            for file_path, file_data in files.items()
                            if not file_path.endswith('__init__.py')]
-            file_coverage.sort(key=lambda x: x[1])
+            file_coverage.sort(key=itemgetter(1))
             
             for file_path, coverage in file_coverage:
-                if coverage < 70:
-                    color = Colors.FAIL
-                    icon = "🔴"
-                elif coverage < 90:
-                    color = Colors.WARNING
-                    icon = "🟡"
-                else:
-                    color = Colors.OKGREEN
-                    icon = "🟢"
+                icon, color = FILE_SUMMARY_STYLES[bisect_right(STATUS_THRESHOLDS, coverage)]
                 
                 # Shorten file path for display
                 short_path = file_path.replace('\\', '/').split('/')[-1]
                 print(f"  {icon} {color}{short_path}: {coverage:.1f}%{Colors.ENDC}")
         
         print(f"\n💡 {Colors.OKCYAN}Quick Access:{Colors.ENDC}")
-        print(f"  • Full HTML report: python run_tests.py coverage-html")
-        print(f"  • All reports: python run_tests.py reports")
+        print("  • Full HTML report: python run_tests.py coverage-html")
+        print("  • All reports: python run_tests.py reports")
         
     except Exception as e:
         print_error(f"Error reading coverage data: {e}")
@@ -1105,27 +822,26 @@ def run_full_test_suite():
     ensure_directories()
     
     # Run tests with coverage and progress bar
-    success = run_command(
-        "python -m pytest Tests/ -v --cov=Strategies --cov=Exchanges --cov=Utils --cov-report=html --cov-report=json --cov-report=xml --cov-report=term-missing --html=reports/test_report.html --self-contained-html",
-        "Running all tests with coverage and reports",
-        show_progress=True
+    success = run_pytest(
+        "Tests/ -v --cov=Strategies --cov=Exchanges --cov=Utils --cov-report=html --cov-report=json --cov-report=xml --cov-report=term-missing --html=reports/test_report.html --self-contained-html",
+        "Running all tests with coverage and reports"
     )
     
     if success:
-        # Analyze coverage results
+        # Analyze coverage results (also parses coverage.json once for the reporters below)
         coverage_ok = check_coverage_results()
         
-        # Generate coverage badge
-        generate_coverage_badge()
-        
-        # Generate enhanced HTML coverage report
-        generate_enhanced_coverage_html()
-        
-        # Generate combined coverage report
-        generate_combined_coverage_html()
-        
-        # Create summary report
-        create_test_summary()
+        # Generate the coverage badge, both HTML reports and the summary concurrently; they only
+        # write files, and load_coverage() hands them the coverage.json parsed above
+        with ThreadPoolExecutor(max_workers=REPORT_WORKERS) as executor:
+            futures = [
+                executor.submit(generate_coverage_badge),
+                executor.submit(generate_enhanced_coverage_html),
+                executor.submit(generate_combined_coverage_html),
+                executor.submit(create_test_summary)
+            ]
+            for future in as_completed(futures):
+                future.result()
         
         # Show quick coverage summary
         show_coverage_summary()
@@ -1184,6 +900,149 @@ python run_tests.py reports
     print_info("Test summary created: reports/test_summary.md")
 
 
+def install_dependencies():
+    """Install the packages the test runner and its reports rely on."""
+    success = run_command(
+        "pip install pytest pytest-cov coverage pytest-html pytest-mock pytest-xdist responses tqdm orjson jinja2",
+        "Installing test dependencies"
+    )
+    if success:
+        print_success("Test dependencies installed successfully!")
+        print_info("You can now run tests with: python run_tests.py all")
+    return success
+
+
+def run_all_and_open_reports():
+    """Run the full suite and open the reports when it passes."""
+    success = run_full_test_suite()
+    if success:
+        print_info("Opening coverage reports...")
+        open_reports()
+    return success
+
+
+def run_unit_tests():
+    """Run only unit tests."""
+    return run_pytest(
+        "Tests/unit/ -v --cov=Strategies --cov=Exchanges --cov=Utils --cov-report=term-missing",
+        "Running unit tests with coverage"
+    )
+
+
+def run_compliance_tests():
+    """Run only compliance tests."""
+    return run_pytest(
+        "Tests/unit/compliance/ -v",
+        "Running compliance tests"
+    )
+
+
+def run_exchange_tests():
+    """Run only exchange implementation tests."""
+    return run_pytest(
+        "Tests/unit/exchanges/ -v --cov=Exchanges --cov-report=term-missing",
+        "Running exchange implementation tests"
+    )
+
+
+def run_strategy_tests():
+    """Run only strategy implementation tests."""
+    return run_pytest(
+        "Tests/unit/strategies/ -v --cov=Strategies --cov-report=term-missing",
+        "Running strategy implementation tests"
+    )
+
+
+def run_integration_tests():
+    """Run only integration tests."""
+    return run_pytest(
+        "Tests/integration/ -v --cov=Strategies --cov=Exchanges --cov-report=term-missing",
+        "Running integration tests"
+    )
+
+
+def run_utils_tests():
+    """Run only utils tests."""
+    return run_pytest(
+        "Tests/unit/utils/ -v --cov=Utils --cov-report=term-missing",
+        "Running utils tests"
+    )
+
+
+def report_coverage():
+    """Print the coverage report for the last run and check it against the target."""
+    ensure_directories()
+    success = run_command(
+        "python -m coverage report --show-missing",
+        "Generating coverage report"
+    )
+    if success:
+        check_coverage_results()
+    return success
+
+
+def open_combined_report():
+    """Generate and open the combined coverage report."""
+    generate_combined_coverage_html()
+    combined_path = "reports/coverage_combined.html"
+    report_file = Path(combined_path).resolve()
+    if report_file.is_file():
+        try:
+            report_uri = report_file.as_uri()
+            open_in_browser(report_file)
+            print_success("Combined coverage report opened in browser")
+            print_info(f"URL: {report_uri}")
+            print_info("✨ Features: Visual progress bars with clickable file links!")
+        except Exception as e:
+            print_error(f"Could not open combined coverage report: {e}")
+    return True
+
+
+def clean_generated_files():
+    """Remove generated reports, coverage data and cache directories."""
+    import shutil
+    dirs_to_clean = ['htmlcov', 'reports', '.pytest_cache', '__pycache__']
+    files_to_clean = ['coverage.json', 'coverage.xml', '.coverage']
+    
+    # Attempt each removal directly; a missing target is the only error worth ignoring
+    for dir_name in dirs_to_clean:
+        try:
+            shutil.rmtree(dir_name)
+        except FileNotFoundError:
+            continue
+        print_info(f"Removed {dir_name}/")
+    
+    for file_name in files_to_clean:
+        try:
+            os.remove(file_name)
+        except FileNotFoundError:
+            continue
+        print_info(f"Removed {file_name}")
+    
+    print_success("Cleaned generated reports and cache files")
+    return True
+
+
+# Command-line command -> handler that runs it
+COMMANDS = {
+    "install": install_dependencies,
+    "all": run_all_and_open_reports,
+    "full": run_all_and_open_reports,
+    "unit": run_unit_tests,
+    "compliance": run_compliance_tests,
+    "exchanges": run_exchange_tests,
+    "strategies": run_strategy_tests,
+    "integration": run_integration_tests,
+    "utils": run_utils_tests,
+    "coverage": report_coverage,
+    "reports": open_reports,
+    "coverage-html": open_coverage_only,
+    "coverage-combined": open_combined_report,
+    "coverage-summary": show_coverage_summary,
+    "clean": clean_generated_files,
+}
+
+
 def main():
     """Enhanced main test runner with coverage enforcement."""
     
@@ -1193,7 +1052,7 @@ def main():
     
     if len(sys.argv) < 2:
         print_header("Crypto Trading Bot - Test Runner")
-        print("Usage: python run_tests.py <command>\n")
+        print("Usage: python run_tests.py <command> [--serial] [--subprocess]\n")
         print(f"{Colors.BOLD}Available commands:{Colors.ENDC}")
         print("  all           - Run all tests with coverage (90% minimum)")
         print("  unit          - Run only unit tests")
@@ -1210,125 +1069,24 @@ def main():
         print("  install       - Install test dependencies")
         print("  clean         - Clean generated reports")
         print("  full          - Run complete test suite with all reports")
+        print(f"\n{Colors.BOLD}Options:{Colors.ENDC}")
+        print("  --serial      - Run pytest in a single process (no pytest-xdist)")
+        print("  --subprocess  - Run pytest in a separate Python process instead of in-process")
         sys.exit(1)
     
     command = sys.argv[1].lower()
+    options = sys.argv[2:]
+    global USE_XDIST, USE_SUBPROCESS
+    if "--serial" in options:
+        USE_XDIST = False
+    if "--subprocess" in options:
+        USE_SUBPROCESS = True
     
-    if command == "install":
-        success = run_command(
-            "pip install pytest pytest-cov coverage pytest-html pytest-mock responses tqdm",
-            "Installing test dependencies"
-        )
-        if success:
-            print_success("Test dependencies installed successfully!")
-            print_info("You can now run tests with: python run_tests.py all")
-    
-    elif command == "all" or command == "full":
-        success = run_full_test_suite()
-        if success:
-            print_info("Opening coverage reports...")
-            open_reports()
-    
-    elif command == "unit":
-        success = run_command(
-            "python -m pytest Tests/unit/ -v --cov=Strategies --cov=Exchanges --cov=Utils --cov-report=term-missing",
-            "Running unit tests with coverage",
-            show_progress=True
-        )
-    
-    elif command == "compliance":
-        success = run_command(
-            "python -m pytest Tests/unit/compliance/ -v",
-            "Running compliance tests",
-            show_progress=True
-        )
-    
-    elif command == "exchanges":
-        success = run_command(
-            "python -m pytest Tests/unit/exchanges/ -v --cov=Exchanges --cov-report=term-missing",
-            "Running exchange implementation tests",
-            show_progress=True
-        )
-    
-    elif command == "strategies":
-        success = run_command(
-            "python -m pytest Tests/unit/strategies/ -v --cov=Strategies --cov-report=term-missing",
-            "Running strategy implementation tests",
-            show_progress=True
-        )
-    
-    elif command == "integration":
-        success = run_command(
-            "python -m pytest Tests/integration/ -v --cov=Strategies --cov=Exchanges --cov-report=term-missing",
-            "Running integration tests",
-            show_progress=True
-        )
-    
-    elif command == "utils":
-        success = run_command(
-            "python -m pytest Tests/unit/utils/ -v --cov=Utils --cov-report=term-missing",
-            "Running utils tests",
-            show_progress=True
-        )
-    
-    elif command == "coverage":
-        ensure_directories()
-        success = run_command(
-            "python -m coverage report --show-missing",
-            "Generating coverage report"
-        )
-        if success:
-            check_coverage_results()
-    
-    elif command == "reports":
-        open_reports()
-        success = True
-    
-    elif command == "coverage-html":
-        open_coverage_only()
-        success = True
-    
-    elif command == "coverage-combined":
-        # Generate and open the combined coverage report
-        generate_combined_coverage_html()
-        combined_path = "reports/coverage_combined.html"
-        if Path(combined_path).exists():
-            try:
-                abs_path = Path(combined_path).absolute()
-                webbrowser.open(f"file://{abs_path}")
-                print_success("Combined coverage report opened in browser")
-                print_info(f"URL: file://{abs_path}")
-                print_info("✨ Features: Visual progress bars with clickable file links!")
-            except Exception as e:
-                print_error(f"Could not open combined coverage report: {e}")
-        success = True
-    
-    elif command == "coverage-summary":
-        show_coverage_summary()
-        success = True
-    
-    elif command == "clean":
-        import shutil
-        dirs_to_clean = ['htmlcov', 'reports', '.pytest_cache', '__pycache__']
-        files_to_clean = ['coverage.json', 'coverage.xml', '.coverage']
-        
-        for dir_name in dirs_to_clean:
-            if Path(dir_name).exists():
-                shutil.rmtree(dir_name)
-                print_info(f"Removed {dir_name}/")
-        
-        for file_name in files_to_clean:
-            if Path(file_name).exists():
-                os.remove(file_name)
-                print_info(f"Removed {file_name}")
-        
-        print_success("Cleaned generated reports and cache files")
-        success = True
-    
-    else:
+    handler = COMMANDS.get(command)
+    if handler is None:
         print_error(f"Unknown command: {command}")
         sys.exit(1)
-
+    handler()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,2 +1,2 @@
 # Live Exchange Implementations
-from .Binance import Binance
+# Modules are imported on demand, see REGISTRY in Exchanges/__init__.py
@@ -222,7 +222,8 @@ class KrakenBackTestClient(Exchange):
         ]
 
         data_list = data
-        with open(filename, mode='w', newline='') as f:
+        # Large buffer so bulk writes aren't split into many small syscalls
+        with open(filename, mode='w', newline='', buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(headers)
             writer.writerows(data_list)
@@ -1,4 +1,2 @@
 # Test and Backtest Exchange Implementations
-from .BinanceBacktestClient import BinanceBacktestClient
-from .KrakenBacktestClient import KrakenBackTestClient
-from .TestExchange import TestExchange
+# Modules are imported on demand, see REGISTRY in Exchanges/__init__.py
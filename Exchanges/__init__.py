@@ -1,14 +1,19 @@
 # Base Exchange Class
 from .exchange import Exchange
 
-# Live Exchange Implementations
-from .Live.Binance import Binance
+# Exchange implementations keyed by the EXCHANGE name used in .env, mapped to
+# (module path within this package, class name). Modules are imported only when
+# selected, so importing this package does not load every exchange's dependencies.
+REGISTRY = {
+    # Live Exchange Implementations
+    "Binance": ("Live.Binance", "Binance"),
 
-# Test/Backtest Exchange Implementations
-from .Test.BinanceBacktestClient import BinanceBacktestClient
-from .Test.KrakenBacktestClient import KrakenBackTestClient
-from .Test.TestExchange import TestExchange
+    # Test/Backtest Exchange Implementations
+    "BinanceBacktestClient": ("Test.BinanceBacktestClient", "BinanceBacktestClient"),
+    "KrakenBacktestClient": ("Test.KrakenBacktestClient", "KrakenBackTestClient"),
+    "TestExchange": ("Test.TestExchange", "TestExchange"),
+}
 
 # If you add more exchanges
-#from .Live.OtherExchange import OtherExchange
-#from .Test.OtherBacktestClient import OtherBacktestClient
\ No newline at end of file
+#REGISTRY["OtherExchange"] = ("Live.OtherExchange", "OtherExchange")
+#REGISTRY["OtherBacktestClient"] = ("Test.OtherBacktestClient", "OtherBacktestClient")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import os
 import signal
 import sys
 from typing import TYPE_CHECKING
@@ -29,6 +30,7 @@ class Strategy(ABC):
         
         # Signal handling for graceful shutdown - common to all strategies
         self.shutdown_requested = False
+        self._shutdown_signal_count = 0
         self._setup_signal_handlers()
 
     def _setup_signal_handlers(self):
@@ -38,7 +40,13 @@ class Strategy(ABC):
         print("Signal handling initialized - Press Ctrl+C for graceful shutdown")
 
     def _signal_handler(self, signum, frame):
-        """Handle shutdown signals (Ctrl+C, SIGTERM) gracefully."""
+        """Handle shutdown signals (Ctrl+C, SIGTERM) gracefully; a second signal forces exit."""
+        self._shutdown_signal_count += 1
+        if self._shutdown_signal_count >= 2:
+            # Graceful shutdown is already under way - skip interpreter finalization entirely
+            print("\nSecond shutdown signal received. Forcing exit...")
+            os._exit(128 + signum)
+        
         signal_name = "SIGINT (Ctrl+C)" if signum == signal.SIGINT else f"Signal {signum}"
         print(f"\n{signal_name} received. Initiating graceful shutdown...")
         self.shutdown_requested = True
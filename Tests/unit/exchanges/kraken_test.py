@@ -292,7 +292,7 @@ class TestKrakenBacktestClient:
         self.client.write_candlestick_to_csv(test_data, "test_output.csv")
         
         # Verify the file was opened for writing
-        mock_open.assert_called_once_with("test_output.csv", mode='w', newline='')
+        mock_open.assert_called_once_with("test_output.csv", mode='w', newline='', buffering=1 << 20)
     
     def test_load_test_data_from_csv_file_not_found(self):
         """Test loading test data from non-existent CSV file."""
@@ -1052,6 +1052,19 @@ class TestGridTradingStrategySignalHandling:
         # Should have set shutdown flag
         assert strategy.is_shutdown_requested() is True
 
+    @patch('Strategies.Strategy.os._exit')
+    def test_second_signal_forces_exit(self, mock_exit):
+        """Test that a second shutdown signal hard-exits instead of waiting for graceful shutdown."""
+        strategy = GridTradingStrategy(
+            self.mock_client, 60, 5, self.metrics_collector
+        )
+        
+        strategy._signal_handler(signal.SIGINT, None)
+        mock_exit.assert_not_called()
+        
+        strategy._signal_handler(signal.SIGINT, None)
+        mock_exit.assert_called_once_with(128 + signal.SIGINT)
+
     def test_programmatic_shutdown_request(self):
         """Test programmatic shutdown request functionality."""
         strategy = GridTradingStrategy(
@@ -0,0 +1,21 @@
+"""
+Pytest plugin that regenerates the dynamic coverage reports in-process
+
+pytest-cov writes coverage.json before the session finishes, so generating the
+reports from pytest_sessionfinish avoids booting a second interpreter just to
+re-read it. Loaded explicitly by run_dynamic_coverage.py:
+
+    python -m pytest Tests/ -p build.core.coverage_report_plugin
+"""
+
+from build.core.generate_coverage_reports import CoverageReportGenerator
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Generate coverage reports once the test session (passing or failing) is done"""
+    # Under pytest-xdist only the controller process has the combined coverage data
+    if hasattr(session.config, 'workerinput'):
+        return
+    
+    generator = CoverageReportGenerator(str(session.config.rootpath))
+    generator.run()
@@ -4,8 +4,8 @@ Dynamic Coverage Runner for Crypto Trading Bot
 
 This script:
 1. Runs the dynamic coverage discovery
-2. Executes pytest with updated configuration
-3. Regenerates the dynamic HTML reports
+2. Executes pytest with updated configuration, regenerating the dynamic
+   HTML reports in the same process (see coverage_report_plugin.py)
 
 Usage: python run_dynamic_coverage.py [pytest-args]
 """
@@ -51,20 +51,18 @@ def main():
     if not run_command(f"{python_exe} build/core/generate_coverage_reports.py", "Dynamic discovery"):
         return 1
     
-    # Step 2: Run tests with coverage
-    print("\nStep 2: Running tests with coverage...")
+    # Step 2: Run tests with coverage; the plugin regenerates the reports at session end
+    print("\nStep 2: Running tests with coverage and regenerating reports...")
     
     # Build pytest command - explicitly add coverage for all main modules
     pytest_args = " ".join(sys.argv[1:]) if len(sys.argv) > 1 else ""
-    pytest_cmd = f"{python_exe} -m pytest Tests/ --cov=Exchanges --cov=Strategies --cov=Utils {pytest_args} -v"
+    pytest_cmd = (
+        f"{python_exe} -m pytest Tests/ --cov=Exchanges --cov=Strategies --cov=Utils "
+        f"-p build.core.coverage_report_plugin {pytest_args} -v"
+    )
     
     if not run_command(pytest_cmd, "Running tests with coverage"):
-        print("Tests completed with failures, but continuing with report generation...")
-    
-    # Step 3: Regenerate dynamic reports
-    print("\nStep 3: Regenerating dynamic coverage reports...")
-    if not run_command(f"{python_exe} build/core/generate_coverage_reports.py", "Regenerating reports"):
-        return 1
+        print("Tests completed with failures, coverage reports were still regenerated")
     
     print("\n" + "=" * 60)
     print("Dynamic coverage analysis complete!")
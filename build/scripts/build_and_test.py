@@ -18,22 +18,34 @@ Examples:
     python build_and_test.py -k test_binance    # Build with specific test filter
     python build_and_test.py --verbose          # Verbose output
     python build_and_test.py --quick            # Skip coverage threshold checks
+    python build_and_test.py --iterative        # Rerun only last-failed tests
 """
 
 import subprocess
 import sys
 import os
 import json
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 import argparse
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Number of trailing output lines kept for the failure summary
+OUTPUT_TAIL_LINES = 200
+
 
 class BuildTestRunner:
     """Comprehensive build and test runner"""
     
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, iterative: bool = False):
         self.project_root = Path(project_root)
+        self.iterative = iterative
         self.start_time = datetime.now()
         self.results = {
             'discovery': False,
@@ -59,29 +71,36 @@ class BuildTestRunner:
         print("-" * 60)
         
     def run_command(self, cmd: str, description: str, critical: bool = True) -> bool:
-        """Run command and handle results"""
+        """Run command, streaming its output to the console as it is produced"""
         print(f"🔄 {description}...")
         
-        result = subprocess.run(
+        # Tee output to the console and keep only the last lines for the error summary
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        process = subprocess.Popen(
             cmd, 
             shell=True, 
-            capture_output=True, 
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
+            bufsize=1,
             cwd=self.project_root
         )
         
-        if result.returncode == 0:
+        for line in process.stdout:
+            print(line, end='')
+            tail.append(line)
+        process.stdout.close()
+        returncode = process.wait()
+        
+        if returncode == 0:
             print(f"✅ {description} - SUCCESS")
-            if result.stdout.strip():
-                print(f"📤 Output: {result.stdout.strip()}")
             return True
         else:
             status = "CRITICAL FAILURE" if critical else "WARNING"
             print(f"❌ {description} - {status}")
-            if result.stderr.strip():
-                print(f"📥 Error: {result.stderr.strip()}")
-            if result.stdout.strip():
-                print(f"📤 Output: {result.stdout.strip()}")
+            error_context = ''.join(tail).strip()
+            if error_context:
+                print(f"📥 Last {len(tail)} lines of output:\n{error_context}")
             
             if critical:
                 print(f"\n💥 BUILD FAILED at: {description}")
@@ -120,6 +139,15 @@ class BuildTestRunner:
             "--strict-markers"
         )
         
+        # Iterative mode reruns only last-failed tests and stops at the first failure;
+        # pytest falls back to the full suite when nothing failed last time
+        if self.iterative:
+            args = pytest_args.split()
+            if "--no-lf" in args:
+                pytest_args = " ".join(arg for arg in args if arg != "--no-lf")
+            else:
+                base_cmd += " --lf --last-failed-no-failures=all -x"
+        
         if pytest_args:
             base_cmd += f" {pytest_args}"
             
@@ -155,10 +183,14 @@ class BuildTestRunner:
                 print("⚠️  Coverage JSON file not found - skipping validation")
                 return True
                 
-            with open(coverage_file, 'r') as f:
-                coverage_data = json.load(f)
-            
-            total_coverage = coverage_data.get('totals', {}).get('percent_covered', 0)
+            if IJSON_AVAILABLE:
+                # Stream only the totals field instead of loading every per-file record
+                with open(coverage_file, 'rb') as f:
+                    total_coverage = float(next(ijson.items(f, 'totals.percent_covered'), 0))
+            else:
+                with open(coverage_file, 'r') as f:
+                    coverage_data = json.load(f)
+                total_coverage = coverage_data.get('totals', {}).get('percent_covered', 0)
             
             print(f"📊 Total Coverage: {total_coverage:.2f}%")
             
@@ -280,6 +312,7 @@ Examples:
   python build_and_test.py -k test_binance    # Run specific tests
   python build_and_test.py --quick            # Skip coverage checks
   python build_and_test.py --threshold 85     # Custom coverage threshold
+  python build_and_test.py --iterative        # Rerun only last-failed tests
         """
     )
     
@@ -296,6 +329,12 @@ Examples:
         help='Skip coverage threshold validation for faster builds'
     )
     
+    parser.add_argument(
+        '--iterative', 
+        action='store_true',
+        help='Run last-failed tests first and stop at the first failure (pass --no-lf to opt out)'
+    )
+    
     # Parse known args to allow pytest arguments to pass through
     args, pytest_args = parser.parse_known_args()
     
@@ -304,7 +343,7 @@ Examples:
     
     # Initialize and run build (go up to project root)
     project_root = Path(__file__).parent.parent.parent
-    builder = BuildTestRunner(str(project_root))
+    builder = BuildTestRunner(str(project_root), iterative=args.iterative)
     
     success = builder.run_full_build(
         pytest_args=pytest_args_str,
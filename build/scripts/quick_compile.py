@@ -13,19 +13,94 @@ Usage:
     python quick_compile.py                  # Quick validation build
     python quick_compile.py --full          # Full test run (may have failures)
     python quick_compile.py --syntax-only   # Just syntax checking
+    python quick_compile.py --no-deps-skip  # Import-check every core module individually
 """
 
 import subprocess
 import sys
 import os
+import json
 from pathlib import Path
 from datetime import datetime
 import argparse
 import ast
+import mmap
+import importlib
+import multiprocessing
 
 # Get the correct Python executable
 PYTHON_EXE = sys.executable
 
+# Cache of files that passed syntax validation, stored next to the build scripts
+COMPILE_MANIFEST = Path(__file__).resolve().parent.parent / ".compile_manifest.json"
+
+# Core modules checked by the import validation step
+CORE_MODULES = [
+    "Strategies.ExchangeModels",
+    "Utils.MetricsCollector",
+    "Exchanges.Live.Binance"
+]
+
+# Core modules that each module above imports transitively; a successful
+# import of the dependent module also proves its dependencies import
+MODULE_DEPENDENCIES = {
+    "Exchanges.Live.Binance": {"Strategies.ExchangeModels"},
+}
+
+# Shared dependencies imported once when each validation worker boots
+PRELOAD_MODULES = ['decouple', 'Strategies.ExchangeModels', 'Utils.MetricsCollector']
+
+# Directory names that are never descended into during syntax validation
+EXCLUDED_DIRS = frozenset({'.venv', '__pycache__', '.git'})
+
+
+def iter_py_files(dir_path: str):
+    """Yield paths of all .py files under dir_path, pruning excluded directories.
+
+    os.scandir reports entry types from the directory listing itself, so no
+    extra stat or Path object is needed per entry.
+    """
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in EXCLUDED_DIRS:
+                    yield from iter_py_files(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry.path
+
+
+def check_syntax(path) -> None:
+    """Parse a Python file to an AST, raising SyntaxError if it is invalid.
+
+    The file is memory-mapped and handed to compile() as bytes, so the source is
+    never decoded into an intermediate str and pages are read in lazily.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap cannot map empty files, and an empty module is valid
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            compile(bytes(mm), str(path), 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+
+
+def _preload_modules(project_root: str, module_names: list):
+    """Worker initializer: make the project importable and warm up shared imports"""
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass  # Reported by the import check itself; a crashing initializer would respawn forever
+
+
+def _import_module(module_name: str) -> tuple[bool, str]:
+    """Worker task: import a module and report whether it succeeded"""
+    try:
+        importlib.import_module(module_name)
+        return True, f"Module {module_name} imports successfully"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
 
 class PracticalBuildRunner:
     """Practical build runner focused on what actually works"""
@@ -40,6 +115,35 @@ class PracticalBuildRunner:
             'coverage_generated': False,
             'build_successful': False
         }
+        self.pool = None
+    
+    def _get_worker_pool(self):
+        """Boot the shared validation worker pool on first use"""
+        if self.pool is None:
+            self.pool = multiprocessing.Pool(
+                processes=min(len(CORE_MODULES), os.cpu_count() or 1),
+                initializer=_preload_modules,
+                initargs=(str(self.project_root.resolve()), PRELOAD_MODULES)
+            )
+        return self.pool
+    
+    def _close_worker_pool(self):
+        """Shut down the validation worker pool if it was started"""
+        if self.pool is not None:
+            # Results are collected before this point; anything still running is abandoned
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+    
+    def _start_import_checks(self, skip_covered: bool = True) -> dict:
+        """Submit import checks to the worker pool without waiting for their results"""
+        pool = self._get_worker_pool()
+        # Dependencies are only checked on their own if the module covering them fails
+        covered = set().union(*MODULE_DEPENDENCIES.values()) if skip_covered else set()
+        return {
+            module: pool.apply_async(_import_module, (module,))
+            for module in CORE_MODULES if module not in covered
+        }
         
     def print_header(self):
         """Print build header"""
@@ -73,21 +177,52 @@ class PracticalBuildRunner:
         
         return success, output
     
+    def _load_compile_manifest(self) -> dict:
+        """Load the cached {path: [size, mtime_ns]} manifest from the last clean syntax check"""
+        try:
+            with open(COMPILE_MANIFEST, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        # Syntax accepted by one interpreter may be rejected by another
+        if manifest.get('python_version') != list(sys.version_info[:3]):
+            return {}
+        return manifest.get('files', {})
+    
+    def _save_compile_manifest(self, files: dict):
+        """Atomically persist the manifest of files that passed syntax validation"""
+        manifest = {'python_version': list(sys.version_info[:3]), 'files': files}
+        tmp_file = COMPILE_MANIFEST.with_suffix('.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            os.replace(tmp_file, COMPILE_MANIFEST)
+        except OSError as e:
+            print(f"⚠️ Could not write compile manifest: {e}")
+    
     def step_1_syntax_validation(self) -> bool:
         """Step 1: Validate Python syntax for all files"""
         self.print_step(1, "SYNTAX VALIDATION")
         
-        python_files = list(self.project_root.rglob("*.py"))
+        python_files = list(iter_py_files(str(self.project_root)))
         syntax_errors = []
         
+        # Files whose (size, mtime) match the last clean run are skipped
+        cached_files = self._load_compile_manifest()
+        checked_files = {}
+        skipped = 0
+        
         for py_file in python_files:
-            if any(exclude in str(py_file) for exclude in ['.venv', '__pycache__', '.git']):
-                continue
-                
             try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                ast.parse(content)
+                st = os.stat(py_file)
+                signature = [st.st_size, st.st_mtime_ns]
+                checked_files[py_file] = signature
+                if cached_files.get(py_file) == signature:
+                    skipped += 1
+                    continue
+                
+                check_syntax(py_file)
             except SyntaxError as e:
                 syntax_errors.append(f"{py_file}: {e}")
             except Exception as e:
@@ -102,30 +237,40 @@ class PracticalBuildRunner:
             self.results['syntax_check'] = False
             return False
         else:
+            self._save_compile_manifest(checked_files)
             print(f"✅ All {len(python_files)} Python files have valid syntax")
+            if skipped:
+                print(f"   ({skipped} unchanged files skipped via {COMPILE_MANIFEST.name})")
             self.results['syntax_check'] = True
             return True
     
-    def step_2_import_validation(self) -> bool:
+    def step_2_import_validation(self, skip_covered: bool = True, pending: dict = None) -> bool:
         """Step 2: Check if core modules can be imported"""
         self.print_step(2, "IMPORT VALIDATION")
         
-        core_modules = [
-            "Strategies.ExchangeModels",
-            "Utils.MetricsCollector",
-            "Exchanges.Live.Binance"
-        ]
-        
         import_failures = []
+        pool = self._get_worker_pool()
+        # Checks already submitted by _start_import_checks, keyed by module
+        pending = dict(pending or {})
+        
+        # Deepest modules first so their successful imports cover the shallow ones
+        modules = sorted(CORE_MODULES, key=lambda m: len(MODULE_DEPENDENCIES.get(m, ())), reverse=True)
+        covered_by = {}
         
-        for module in core_modules:
+        for module in modules:
+            if skip_covered and module in covered_by:
+                print(f"⏭️ Import {module} (covered by {covered_by[module]})")
+                continue
             try:
-                success, output = self.run_command(
-                    f'{PYTHON_EXE} -c "import {module}; print(\\"Module {module} imports successfully\\")"',
-                    f"Import {module}",
-                    critical=False
-                )
-                if not success:
+                if module not in pending:
+                    pending[module] = pool.apply_async(_import_module, (module,))
+                success, output = pending[module].get()
+                status = "✅" if success else "⚠️"
+                print(f"{status} Import {module}")
+                if success:
+                    for dependency in MODULE_DEPENDENCIES.get(module, ()):
+                        covered_by.setdefault(dependency, module)
+                else:
                     import_failures.append(f"{module}: {output}")
             except Exception as e:
                 import_failures.append(f"{module}: {e}")
@@ -227,11 +372,15 @@ class PracticalBuildRunner:
         
         print("=" * 70)
     
-    def run_build(self, syntax_only: bool = False, run_full_tests: bool = False) -> bool:
+    def run_build(self, syntax_only: bool = False, run_full_tests: bool = False,
+                  skip_covered_imports: bool = True) -> bool:
         """Run the practical build process"""
         self.print_header()
         
         try:
+            # Import checks run in the worker pool while syntax is validated here
+            pending_imports = None if syntax_only else self._start_import_checks(skip_covered_imports)
+            
             # Step 1: Syntax validation (critical)
             if not self.step_1_syntax_validation():
                 print("\n💥 CRITICAL: Syntax errors must be fixed before proceeding!")
@@ -242,7 +391,7 @@ class PracticalBuildRunner:
                 return True
             
             # Step 2: Import validation (informational)
-            self.step_2_import_validation()
+            self.step_2_import_validation(skip_covered_imports, pending_imports)
             
             # Step 3: Basic tests (informational)
             self.step_3_basic_tests(run_full_tests)
@@ -259,6 +408,7 @@ class PracticalBuildRunner:
             print(f"\n💥 Unexpected error during build: {e}")
             return False
         finally:
+            self._close_worker_pool()
             if not syntax_only:
                 self.print_summary()
 
@@ -281,6 +431,12 @@ def main():
         help='Run full test suite (may have failures)'
     )
     
+    parser.add_argument(
+        '--no-deps-skip', 
+        action='store_true',
+        help='Import every core module even if another module already imported it'
+    )
+    
     args = parser.parse_args()
     
     # Initialize and run build (go up to project root: build/scripts -> build -> project_root)
@@ -289,7 +445,8 @@ def main():
     
     success = builder.run_build(
         syntax_only=args.syntax_only,
-        run_full_tests=args.full
+        run_full_tests=args.full,
+        skip_covered_imports=not args.no_deps_skip
     )
     
     # Exit with appropriate code
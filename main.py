@@ -1,90 +1,159 @@
 #!/usr/bin/python3
 import sys
-import threading
 import importlib
+import importlib.util
+import pkgutil
 import os
-from decouple import config
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from decouple import AutoConfig
 
 # Add current directory and utils to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
-sys.path.insert(0, os.path.join(current_dir, 'utils'))
+# (guarded so re-imports don't keep invalidating the import system's path caches)
+current_dir = str(Path(__file__).resolve().parent)
+for import_path in (current_dir, os.path.join(current_dir, 'utils')):
+    if import_path not in sys.path:
+        sys.path.insert(0, import_path)
 
 # Local imports
-import Exchanges
-from Tests.utils import StrategyWrapper
-from Utils.MetricsCollector import MetricsCollector
-
-# Constants for configuration keys
-EXCHANGE_NAME = "exchange_name"
-AVAILABLE_EXCHANGES = "available_exchanges"
-MODE = "mode"
-STRATEGY = "strategy"
-TRADING_MODE = "trading_mode"
-INTERVAL = "interval"
-CURRENCY = "currency"
-ASSET = "asset"
-API_KEY = "key"
-API_SECRET = "secret"
-TRADE_INTERVAL = "trade_interval"
+import Strategies
+from Exchanges import REGISTRY as EXCHANGE_REGISTRY
+from Strategies.Strategy import Strategy
+
 TEST_DATA_DIRECTORY = "Tests/data"
 
+# Required .env keys, read once at startup
+ENV_KEYS = (
+    'EXCHANGE', 'AVAILABLE_EXCHANGES', 'MODE', 'STRATEGY', 'TRADING_MODE', 'CANDLE_INTERVAL',
+    'CURRENCY', 'ASSET', 'API_KEY', 'API_SECRET', 'TRADE_INTERVAL'
+)
+_config = AutoConfig(search_path=current_dir)
+_ENV = {key: _config(key) for key in ENV_KEYS}
+
+def _import(module_path):
+    """Returns the module, checking sys.modules before taking the import machinery's lock."""
+    module = sys.modules.get(module_path)
+    return module if module is not None else importlib.import_module(module_path)
+
+def _build_registry(package, base_class):
+    """Maps class and module names to the base_class subclasses defined in each module of package."""
+    registry = {}
+    for module_info in pkgutil.iter_modules(package.__path__, f"{package.__name__}."):
+        module = _import(module_info.name)
+        for obj in vars(module).values():
+            if (isinstance(obj, type) and issubclass(obj, base_class) and obj is not base_class
+                    and obj.__module__ == module.__name__):
+                registry[obj.__name__] = obj
+                # Config values name the module, which can differ in case from the class
+                registry.setdefault(module_info.name.rpartition('.')[2], obj)
+    return registry
+
+# Strategy classes resolved once at startup, keyed by name
+STRATEGY_REGISTRY = _build_registry(Strategies, Strategy)
+
+# Absolute (module path, class name) for each registered exchange
+_EXCHANGE_PATHS = {
+    name: (f"Exchanges.{module_path}", class_name)
+    for name, (module_path, class_name) in EXCHANGE_REGISTRY.items()
+}
+
+@dataclass(frozen=True)
+class BotConfig:
+    """Bot settings read from .env; __slots__ keeps attribute access off a per-instance dict."""
+    __slots__ = (
+        'exchange_name', 'available_exchanges', 'mode', 'strategy', 'trading_mode', 'interval',
+        'currency', 'asset', 'key', 'secret', 'trade_interval'
+    )
+    exchange_name: str
+    available_exchanges: tuple
+    mode: str
+    strategy: str
+    trading_mode: str
+    interval: int
+    currency: str
+    asset: str
+    key: str
+    secret: str
+    trade_interval: int
+
+@lru_cache(maxsize=1)
 def load_configuration():
-    """Loads configuration from environment variables."""
-    return {
-        EXCHANGE_NAME: config('EXCHANGE'),
-        AVAILABLE_EXCHANGES: config('AVAILABLE_EXCHANGES').split(','),
-        MODE: config('MODE'),
-        STRATEGY: config('STRATEGY'),
-        TRADING_MODE: config('TRADING_MODE'),
-        INTERVAL: int(config('CANDLE_INTERVAL')),
-        CURRENCY: config('CURRENCY'),
-        ASSET: config('ASSET'),
-        API_KEY: config('API_KEY'),
-        API_SECRET: config('API_SECRET'),
-        TRADE_INTERVAL: config('TRADE_INTERVAL')
-    }
+    """Loads configuration from environment variables (built once per process)."""
+    return BotConfig(
+        exchange_name=_ENV['EXCHANGE'],
+        available_exchanges=tuple(_ENV['AVAILABLE_EXCHANGES'].split(',')),
+        mode=_ENV['MODE'],
+        strategy=_ENV['STRATEGY'],
+        trading_mode=_ENV['TRADING_MODE'],
+        interval=int(_ENV['CANDLE_INTERVAL']),
+        currency=_ENV['CURRENCY'],
+        asset=_ENV['ASSET'],
+        key=_ENV['API_KEY'],
+        secret=_ENV['API_SECRET'],
+        trade_interval=int(_ENV['TRADE_INTERVAL'])
+    )
+
+def _parse_currency_pair(pair):
+    """Splits a CURRENCY_ASSET argument such as BTC_USD into its two symbols."""
+    currency, sep, asset = pair.partition('_')
+    if not sep or not currency or not asset or '_' in asset:
+        raise ValueError(f"Invalid keyboard input when executing bot: '{pair}'")
+    return currency, asset
 
 def handle_cli_arguments(currency, asset):
     """Handles CLI arguments for currency/asset pair."""
     if len(sys.argv) > 1:
-        currencies = sys.argv[1].split('_')
-        if len(currencies) > 1:
-            print(f'Using Currency and Asset: [{currencies[0]}, {currencies[1]}]')
-            return currencies[0], currencies[1]
-        else:
-            raise ValueError(f"Invalid keyboard input when executing bot: '{sys.argv[1]}'")
+        currency, asset = _parse_currency_pair(sys.argv[1])
+        print(f'Using Currency and Asset: [{currency}, {asset}]')
+        return currency, asset
     else:
         print(f"No system arguments used: defaulting to config currency={currency}, asset={asset}")
         return currency, asset
 
-def initialize_exchange_client(exchange_name, key, secret, currency, asset, metrics_collector):
-    """Dynamically imports and initializes the exchange client."""
-    if exchange_name.endswith("BacktestClient"):
-        # Backtest clients
-        exchange_module = importlib.import_module(f"Exchanges.Test.{exchange_name}")
-    elif exchange_name == "TestExchange":
-        # Test exchange - file name is TestExchange.py and class is TestExchange
-        exchange_module = importlib.import_module("Exchanges.Test.TestExchange")
+def _exchange_location(exchange_name):
+    """Returns the (module path, class name) implementing exchange_name."""
+    if exchange_name in _EXCHANGE_PATHS:
+        return _EXCHANGE_PATHS[exchange_name]
+    elif exchange_name.endswith("BacktestClient"):
+        # Unregistered backtest clients: file name matches class name
+        return f"Exchanges.Test.{exchange_name}", exchange_name
     else:
-        # Live clients
-        exchange_module = importlib.import_module(f"Exchanges.Live.{exchange_name}")
-    exchange_class = getattr(exchange_module, exchange_name)
+        # Unregistered live clients: file name matches class name
+        return f"Exchanges.Live.{exchange_name}", exchange_name
+
+@lru_cache(maxsize=None)
+def _resolve_exchange_cls(exchange_name):
+    """Returns the exchange class for exchange_name, importing its module on first use."""
+    module_path, class_name = _exchange_location(exchange_name)
+    exchange_module = _import(module_path)
+    return getattr(exchange_module, class_name)
+
+@lru_cache(maxsize=None)
+def _resolve_strategy_cls(strategy_name):
+    """Returns the strategy class for strategy_name, importing it if it is not registered."""
+    if strategy_name in STRATEGY_REGISTRY:
+        return STRATEGY_REGISTRY[strategy_name]
+    strategy_module = _import(f"Strategies.{strategy_name}")
+    return getattr(strategy_module, strategy_name)
+
+def initialize_exchange_client(exchange_name, key, secret, currency, asset, metrics_collector):
+    """Imports only the selected exchange module and initializes its client."""
+    exchange_class = _resolve_exchange_cls(exchange_name)
     return exchange_class(key, secret, currency, asset, metrics_collector)
 
 def initialize_strategy(strategy_name, client, interval, metrics_collector):
-    """Dynamically imports and initializes the strategy."""
+    """Initializes the strategy with parameters suited to its type."""
     print(f"Using {strategy_name} to determine trades")
-    strategy_module = importlib.import_module(f"Strategies.{strategy_name}")
-    strategy_class = getattr(strategy_module, strategy_name)
+    strategy_class = _resolve_strategy_cls(strategy_name)
     
     # Initialize strategy with appropriate parameters based on strategy type
     if strategy_name == "SimpleMovingAverageStrategy":
         # SMA strategy with default parameters (can be customized via environment variables)
-        short_window = int(config('SMA_SHORT_WINDOW', default=10))
-        long_window = int(config('SMA_LONG_WINDOW', default=20))
-        min_candles = int(config('SMA_MIN_CANDLES', default=50))
-        trade_quantity = float(config('SMA_TRADE_QUANTITY', default=1.0))
+        short_window = int(_config('SMA_SHORT_WINDOW', default=10))
+        long_window = int(_config('SMA_LONG_WINDOW', default=20))
+        min_candles = int(_config('SMA_MIN_CANDLES', default=50))
+        trade_quantity = float(_config('SMA_TRADE_QUANTITY', default=1.0))
         
         return strategy_class(
             client=client, 
@@ -100,69 +169,110 @@ def initialize_strategy(strategy_name, client, interval, metrics_collector):
         # Default initialization for other strategies (e.g., GridTradingStrategy)
         return strategy_class(client, interval, 5, metrics_collector)
 
+def _real_client(config, currency, asset, metrics_collector):
+    """Connects to the configured exchange for real trading."""
+    sys.stdout.write("*** Caution: Real trading mode activated ***\n"
+                     f"Connecting to {config.exchange_name} exchange...\n")
+    return initialize_exchange_client(config.exchange_name, config.key, config.secret, currency, asset, metrics_collector)
+
+def _test_client(config, currency, asset, metrics_collector):
+    """Connects to the test exchange (live data, simulated trades)."""
+    sys.stdout.write("*** Live Testing Mode Enabled ***\n"
+                     "Using Test Binance Client for strategy testing...\n")
+    return initialize_exchange_client("TestExchange", config.key, config.secret, currency, asset, metrics_collector)
+
+# Exchange client factories keyed by TRADING_MODE
+CLIENT_FACTORIES = {"real": _real_client, "test": _test_client}
+
 def run_trading_mode(config):
     """Runs the bot in real trading mode."""
+    from Utils.MetricsCollector import MetricsCollector
+
     # Create metrics collector
     metrics_collector = MetricsCollector()
     
     # Handle CLI arguments
-    currency, asset = handle_cli_arguments(config["currency"], config["asset"])
-    if config[TRADING_MODE] == "real": 
-        print("*** Caution: Real trading mode activated ***")
-        print(f"Connecting to {config['exchange_name']} exchange...")
-        # Initialize Exchange Client
-        client = initialize_exchange_client(config["exchange_name"], config["key"], config["secret"], currency, asset, metrics_collector)
-    elif config[TRADING_MODE] == "test":
-        print("*** Live Testing Mode Enabled ***")
-        print("Using Test Binance Client for strategy testing...")
-        client = Exchanges.TestExchange(config[API_KEY], config[API_SECRET], currency, asset, metrics_collector)
+    currency, asset = handle_cli_arguments(config.currency, config.asset)
+    client_factory = CLIENT_FACTORIES.get(config.trading_mode)
+    if client_factory is None:
+        raise ValueError(f'Incorrect Trading Mode value provided in .env: {config.trading_mode}')
+    client = client_factory(config, currency, asset, metrics_collector)
 
     # Initialize and run the strategy
-    strategy_instance = initialize_strategy(config[STRATEGY], client, config[INTERVAL], metrics_collector)
+    strategy_instance = initialize_strategy(config.strategy, client, config.interval, metrics_collector)
     
-    print("🚀 Starting trading strategy...")
-    print("   Strategy will handle its own execution loop and signal management")
-    strategy_instance.run_strategy(int(config[TRADE_INTERVAL]))
+    sys.stdout.write("🚀 Starting trading strategy...\n"
+                     "   Strategy will handle its own execution loop and signal management\n")
+    strategy_instance.run_strategy(config.trade_interval)
     
     print("✅ Trading strategy completed execution")
 
 def run_test_mode(config):
     """Runs the bot in test mode."""
+    # Backtest-only helpers are imported here so trade mode doesn't load them
+    from Tests.utils import StrategyWrapper
+    from Utils.MetricsCollector import MetricsCollector
+
     # Create metrics collector
     metrics_collector = MetricsCollector()
 
     # Connect to Test Client
-    print("BackTest mode enabled...")
-    print(f"Using {config[EXCHANGE_NAME]} for collecting data...")
-    currency, asset = handle_cli_arguments(config[CURRENCY], config[ASSET])
-    TestClient = initialize_exchange_client(config[EXCHANGE_NAME], config[API_KEY], config[API_SECRET], currency, asset, metrics_collector)
+    sys.stdout.write("BackTest mode enabled...\n"
+                     f"Using {config.exchange_name} for collecting data...\n")
+    currency, asset = handle_cli_arguments(config.currency, config.asset)
+    TestClient = initialize_exchange_client(config.exchange_name, config.key, config.secret, currency, asset, metrics_collector)
 
     # Collect Historical Data
     yearsPast = 1
-    print(f"Writing Historical Data for past {yearsPast} year(s) with interval of {config[INTERVAL]} minutes")
-    historicalData = TestClient.get_historical_candle_stick_data(config[INTERVAL], yearsPast)
+    print(f"Writing Historical Data for past {yearsPast} year(s) with interval of {config.interval} minutes")
+    historicalData = TestClient.get_historical_candle_stick_data(config.interval, yearsPast)
     TestClient.write_candlestick_to_csv(historicalData, f"{TEST_DATA_DIRECTORY}/past-{yearsPast}-years-historical-data-{currency}{asset}.csv")
     
     # Initialize Strategy and Strategy Wrapper
-    strategy_instance = initialize_strategy(config[STRATEGY], TestClient, config[INTERVAL], metrics_collector)
+    strategy_instance = initialize_strategy(config.strategy, TestClient, config.interval, metrics_collector)
     strategy_wrapper = StrategyWrapper(strategy_instance)
 
     # Execute the Backtest
     strategy_wrapper.run_strategy()
 
 
-if __name__ == "__main__":
+# Bot runners keyed by MODE
+MODE_DISPATCH = {"backtest": run_test_mode, "trade": run_trading_mode}
+
+def _validate_config(config):
+    """Rejects bad modes, exchange/strategy names and CLI pairs before anything connects."""
+    if config.mode not in MODE_DISPATCH:
+        raise ValueError(f'Incorrect Mode value provided in .env: {config.mode}')
+    if config.mode == "trade" and config.trading_mode not in CLIENT_FACTORIES:
+        raise ValueError(f'Incorrect Trading Mode value provided in .env: {config.trading_mode}')
+
+    # Live-testing trade mode always uses TestExchange, so EXCHANGE only matters otherwise
+    if config.mode == "backtest" or config.trading_mode == "real":
+        module_path, _ = _exchange_location(config.exchange_name)
+        if importlib.util.find_spec(module_path) is None:
+            raise ValueError(f'Unknown Exchange provided in .env: {config.exchange_name}')
+    if (config.strategy not in STRATEGY_REGISTRY
+            and importlib.util.find_spec(f"Strategies.{config.strategy}") is None):
+        raise ValueError(f'Unknown Strategy provided in .env: {config.strategy}')
+
+    if len(sys.argv) > 1:
+        _parse_currency_pair(sys.argv[1])
+
+def main():
+    """Entry point: load configuration and run the bot in the configured mode."""
     # Load configuration
     config_data = load_configuration()
+    _validate_config(config_data)
+    run_mode = MODE_DISPATCH[config_data.mode]
 
-    print("🤖 Crypto Trading Bot Starting...")
-    print("📝 Note: Signal handling is now managed by the trading strategy")
-    print("   Press Ctrl+C during strategy execution for graceful shutdown")
-    print()
+    # One write for the whole banner instead of a syscall per line
+    sys.stdout.write("🤖 Crypto Trading Bot Starting...\n"
+                     "📝 Note: Signal handling is now managed by the trading strategy\n"
+                     "   Press Ctrl+C during strategy execution for graceful shutdown\n"
+                     "\n")
 
-    if config_data[MODE] == "backtest":
-        run_test_mode(config_data)
-    elif config_data[MODE] == "trade":
-        run_trading_mode(config_data)
-    else:
-        raise ValueError(f'Incorrect Mode value provided in .env: {config_data[MODE]}')
\ No newline at end of file
+    run_mode(config_data)
+
+
+if __name__ == "__main__":
+    main()
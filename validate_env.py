@@ -6,7 +6,7 @@ Checks if your .env file is properly configured for the Crypto Trading Bot
 
 import os
 import sys
-from decouple import config, UndefinedValueError
+from decouple import Config, RepositoryEnv, UndefinedValueError
 
 def validate_env():
     """Validate the .env configuration"""
@@ -34,6 +34,9 @@ def validate_env():
         print("💡 Run './setup.sh' or copy '.env.example' to '.env'")
         return False
     
+    # Parse .env once; each lookup below is then a dict access (environment variables still take precedence)
+    config = Config(RepositoryEnv('.env'))
+    
     errors = []
     warnings = []
     
@@ -73,7 +76,7 @@ def validate_env():
         trading_mode = config('TRADING_MODE') 
         exchange = config('EXCHANGE')
         
-        print(f"\n🎯 Configuration Summary:")
+        print("\n🎯 Configuration Summary:")
         print(f"   Mode: {mode}")
         print(f"   Trading Mode: {trading_mode}")
         print(f"   Exchange: {exchange}")
@@ -83,7 +86,7 @@ def validate_env():
             if not exchange.endswith('BacktestClient'):
                 warnings.append("💡 For backtesting, consider using BinanceBacktestClient or KrakenBacktestClient")
         elif mode == 'trade' and trading_mode == 'real':
-            print(f"   ⚠️  CAUTION: Real trading mode enabled!")
+            print("   ⚠️  CAUTION: Real trading mode enabled!")
             if config('API_KEY') in ['YOUR_API_KEY_HERE', '']:
                 errors.append("❌ Real trading requires valid API credentials")
     
@@ -91,7 +94,7 @@ def validate_env():
         errors.append(f"❌ Configuration validation error: {e}")
     
     # Final status
-    print("\n" + "=" * 40)
+    print(f"\n{'=' * 40}")
     if errors:
         print("❌ Configuration validation FAILED")
         print("   Please fix the errors above before running the bot")